@@ -1,22 +1,32 @@
 #!/usr/bin/env python3
 import subprocess
+import sys
+import threading
 import time
 import json
 import os
 import re
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import shutil
 import errno
 import atexit
-import os
+import hashlib
+import functools
+from collections import OrderedDict, namedtuple
+from concurrent.futures import Future
 from pygments import highlight
 from pygments.lexers import JsonLexer
 from pygments.formatters import Terminal256Formatter
 from packaging.version import parse as parse_version
 from pygments.token import Token
-from pygments.style import Style
 from pygments.formatter import Formatter
-from io import StringIO
+
+try:
+    import orjson  # Optional, much faster on large RPC responses
+except ImportError:
+    orjson = None
 
 
 
@@ -26,19 +36,39 @@ def load_daemon_config(path="daemons.json"):
 
 daemons = load_daemon_config()
 
-class ErrStyle(Style):
-    default_style = ""
-    styles = {
-        Token.Generic.Error: "bold ansired",
-    }
-
-_fmt = Terminal256Formatter(style=ErrStyle)
+_VER_RE = re.compile(r"(\d+\.\d+\.\d+)")
+_TS_RE = re.compile(r'^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2} ')
+_TS_LEN = 20  # len("YYYY-MM-DD HH:MM:SS ")
+
+# Paths for the selected daemon, resolved once by preflight_paths and reused
+DaemonPaths = namedtuple("DaemonPaths", ["cli_abs", "daemon_abs", "data_dir", "ok"])
+
+# ANSI codes matching what Terminal256Formatter emits for these tokens
+_RED = "\x1b[31;01m"
+_YELLOW_BOLD = "\x1b[33;01m"
+_CYAN = "\x1b[36m"
+_RESET = "\x1b[39;00m"
+_RESET_FG = "\x1b[39m"
+
+_TOKEN_ANSI = {
+    Token.Generic.Error: (_RED, _RESET),
+    Token.Generic.Heading: (_YELLOW_BOLD, _RESET),
+    Token.Generic.Subheading: (_CYAN, _RESET_FG),
+}
+
+def _colorize(text: str, token_type) -> str:
+    start, end = _TOKEN_ANSI[token_type]
+    if "\n" not in text:
+        return f"{start}{text}{end}" if text else text
+    # Color each line separately so the codes never span a newline
+    return "\n".join(f"{start}{line}{end}" if line else line for line in text.split("\n"))
 
 def red_error(text: str) -> str:
-    buf = StringIO()
-    _fmt.format([(Token.Generic.Error, text)], buf)
-    return buf.getvalue()
+    return _colorize(text, Token.Generic.Error)
+
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 
+@functools.lru_cache(maxsize=256)
 def _expand_abs(path: str) -> str:
     if not path:
         return path
@@ -46,13 +76,13 @@ def _expand_abs(path: str) -> str:
     if os.path.isabs(path):
         return path
     # Resolve relative to the script directory, not the current working dir
-    base = os.path.dirname(os.path.abspath(__file__))
-    return os.path.abspath(os.path.join(base, path))
+    return os.path.abspath(os.path.join(_SCRIPT_DIR, path))
 
 def _is_gvfs_path(path: str) -> bool:
     # Common indicator for GVFS SFTP mounts on Linux
     return path.startswith("/run/user/") and "/gvfs/" in path
 
+@functools.lru_cache(maxsize=256)
 def resolve_executable(path: str) -> str | None:
     """
     Accept absolute/relative paths or bare program names.
@@ -109,25 +139,146 @@ def enable_history(histfile="~/.cache/daemon-cli-history"):
     except FileNotFoundError:
         pass
 
+    readline.set_history_length(1000)
     atexit.register(lambda: readline.write_history_file(path))
     return True
 
-def get_local_version(cli_path, cli_args, field, data_dir):
-    info = getinfo(cli_path, data_dir, cli_args)
+def _load_rpc_methods(daemon_name, cli_path, data_dir, cli_args):
+    """
+    Returns the daemon's RPC method names, parsed from `help` once and cached on disk.
+    The cache is keyed on the CLI binary's mtime so an upgraded binary refreshes it.
+    """
+    try:
+        cli_mtime = os.stat(cli_path).st_mtime
+    except OSError:
+        return []
+    cache_path = os.path.join(os.path.expanduser(CACHE_DIR), f"{daemon_name.lower()}-methods.json")
+    cached = _read_json_cache(cache_path)
+    if cached and cached.get("cli_mtime") == cli_mtime:
+        return cached.get("methods", [])
+
+    try:
+        result = subprocess.run([cli_path, f"-datadir={data_dir}"] + cli_args + ["help"], capture_output=True, text=True)
+    except Exception:
+        return []
+    if result.returncode != 0:
+        return []
+    # help lists one "method args..." per line, grouped under "== Section ==" headers
+    methods = sorted({
+        line.split()[0] for line in result.stdout.splitlines()
+        if line.strip() and not line.startswith("==")
+    })
+    _write_json_cache(cache_path, {"cli_mtime": cli_mtime, "methods": methods})
+    return methods
+
+def enable_completion(daemon_name, cli_path, data_dir, cli_args):
+    """Tab-completes RPC method names at the start of the command line."""
+    try:
+        import readline  # noqa
+    except Exception:
+        return False
+
+    methods = _load_rpc_methods(daemon_name, cli_path, data_dir, cli_args) + ["exit"]
+
+    def completer(text, state):
+        if readline.get_begidx() != 0:
+            return None  # Only the method name, not its arguments
+        matches = [m for m in methods if m.startswith(text)]
+        return matches[state] if state < len(matches) else None
+
+    readline.set_completer(completer)
+    if "libedit" in (readline.__doc__ or ""):
+        readline.parse_and_bind("bind ^I rl_complete")  # macOS
+    else:
+        readline.parse_and_bind("tab: complete")
+    return True
+
+def get_local_version(cli_path, cli_args, field, data_dir, daemon=None):
+    info = getinfo(cli_path, data_dir, cli_args, daemon, verify_down=True)
     if "error" in info:
         print(red_error(f"Error getting local version: {info['error']}"))
         return None
     return info.get(field)
 
-def get_remote_version(api_url, field):
+CACHE_DIR = "~/.cache/anchord"
+REMOTE_VERSION_TTL = 3600  # seconds
+
+# One pooled session so repeated/parallel lookups reuse the TCP + TLS connection
+_session = requests.Session()
+_session.headers["User-Agent"] = "anchord"
+_session.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    # Only retry connect/read failures; never sit out a Retry-After (GitHub sends 60s+)
+    max_retries=Retry(total=2, status=0, backoff_factor=0.3, respect_retry_after_header=False),
+))
+
+def _remote_cache_path(api_url):
+    key = hashlib.sha1(api_url.encode("utf-8")).hexdigest()[:16]
+    return os.path.join(os.path.expanduser(CACHE_DIR), f"release-{key}.json")
+
+def _read_json_cache(path):
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def _write_json_cache(path, entry):
+    """Write the cache entry atomically (tmp + rename); failures are not fatal."""
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(entry, f)
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+def fetch_remote_version(api_url, field):
+    """
+    Returns (version, html_url, error) for the latest GitHub release without printing,
+    so it can run in the background. error is None on success.
+    Responses are cached on disk for REMOTE_VERSION_TTL seconds, after which the
+    cached ETag is revalidated so an unchanged release costs a 304 instead of a full
+    response (304s don't count towards GitHub's unauthenticated rate limit).
+    """
+    cache_path = _remote_cache_path(api_url)
+    cached = _read_json_cache(cache_path)
+    if cached and field not in cached.get("data", {}):
+        cached = None  # Cached for a different version_field
+    if cached and time.time() - cached.get("fetched_at", 0) < REMOTE_VERSION_TTL:
+        return cached["data"][field], cached["data"].get("html_url"), None
+
+    headers = {}
+    if cached and cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
     try:
-        resp = requests.get(api_url, timeout=5)
+        resp = _session.get(api_url, headers=headers, timeout=(2, 5))
+        if resp.status_code == 304 and cached:
+            cached["fetched_at"] = time.time()
+            _write_json_cache(cache_path, cached)
+            return cached["data"][field], cached["data"].get("html_url"), None
         resp.raise_for_status()
         data = resp.json()
-        return data.get(field), data.get("html_url") 
+        _write_json_cache(cache_path, {
+            "etag": resp.headers.get("ETag"),
+            "fetched_at": time.time(),
+            "data": {field: data.get(field), "html_url": data.get("html_url")},
+        })
+        return data.get(field), data.get("html_url"), None
     except Exception as e:
-        print(f"Error fetching remote version: {e}")
-        return None, None
+        if cached:
+            # Stale is better than nothing (e.g. offline or rate limited)
+            return cached["data"][field], cached["data"].get("html_url"), e
+        return None, None, e
+
+def get_remote_version(api_url, field):
+    """Returns (version, html_url) for the latest GitHub release, reporting fetch errors."""
+    version, html_url, error = fetch_remote_version(api_url, field)
+    if error:
+        print(f"Error fetching remote version: {error}")
+    return version, html_url
 
 def normalize_version(v):
     """Return a string version, handling ints and raw values from RPC."""
@@ -136,37 +287,61 @@ def normalize_version(v):
     v = str(v).strip()
     if v.startswith("v"):
         v = v[1:]
-    match = re.search(r"(\d+\.\d+\.\d+)", v)
+    match = _VER_RE.search(v)
     return match.group(1) if match else v
 
-class VersionCheckStyle(Style):
-    default_style = ""
-    styles = {
-        Token.Generic.Heading: "bold ansiyellow",
-        Token.Generic.Error: "bold ansired",
-        Token.Generic.Subheading: "ansicyan",
-    }
+def highlight_text(text, token_type):
+    """Format a string using the ANSI color for the specified token type."""
+    return _colorize(text.strip(), token_type)
 
-formatter = Terminal256Formatter(style=VersionCheckStyle)
 
-def highlight_text(text, token_type):
-    """Format a string using the specified token type and custom style."""
-    out = StringIO()
-    formatter.format([(token_type, text)], out)
-    return out.getvalue().strip()
+def _in_background(fn, *args):
+    """
+    Runs fn(*args) on a daemon thread and returns a Future for its result. Unlike an
+    executor's workers, the thread doesn't hold up interpreter exit if nobody waits on it.
+    """
+    future = Future()
+
+    def run():
+        try:
+            future.set_result(fn(*args))
+        except BaseException as e:
+            future.set_exception(e)
 
+    threading.Thread(target=run, daemon=True).start()
+    return future
 
-def check_versions(daemon_config):
+def prefetch_remote_versions(daemon_configs):
+    """
+    Starts fetching the latest GitHub versions for several daemons in parallel.
+    Returns {(github_api, version_field): Future of (version, html_url, error)};
+    daemons sharing a release URL (e.g. PBaaS chains) are only fetched once.
+    """
+    wanted = {
+        (d["version_check"]["github_api"], d["version_check"]["version_field"])
+        for d in daemon_configs if "version_check" in d
+    }
+    return {key: _in_background(fetch_remote_version, *key) for key in wanted}
+
+def check_versions(daemon_config, paths, remote_versions=None):
     cli_ver_raw = get_local_version(
-        daemon_config["cli_path"],
+        paths.cli_abs,
         daemon_config.get("cli_args", []),
         daemon_config["version_check"]["cli_field"],
-        daemon_config["data_dir"]
+        paths.data_dir,
+        daemon_config
     )
-    remote_ver_raw, html_url = get_remote_version(
+    remote_key = (
         daemon_config["version_check"]["github_api"],
         daemon_config["version_check"]["version_field"]
     )
+    if remote_versions and remote_key in remote_versions:
+        # Prefetched quietly; report any error here rather than mid-startup
+        remote_ver_raw, html_url, error = remote_versions[remote_key].result()
+        if error:
+            print(f"Error fetching remote version: {error}")
+    else:
+        remote_ver_raw, html_url = get_remote_version(*remote_key)
 
     cli_ver = normalize_version(cli_ver_raw)
     remote_ver = normalize_version(remote_ver_raw)
@@ -202,8 +377,95 @@ def check_versions(daemon_config):
     
     print("\n") 
 
-def getinfo(cli_path, data_dir, cli_args):
-    """Runs getinfo command to check if the daemon is running."""
+# CLI options that change how the CLI reaches the daemon; when present, leave it to the CLI
+_RPC_OVERRIDE_ARGS = ("-conf=", "-datadir=", "-rpc")
+# CLI options that select a chain other than the one whose .conf sits in data_dir
+_CHAIN_SELECT_ARGS = ("-chain=", "-testnet", "-regtest", "-ac_name=")
+_RPC_REFUSED_ERROR = "error: couldn't connect to server"
+
+def read_rpc_config(data_dir, daemon=None, cli_args=()):
+    """
+    Returns (url, (user, password)) for calling the daemon's JSON-RPC directly,
+    or None if the port and credentials can't be read from its .conf / .cookie.
+    """
+    conf_dir = resolve_log_dir(data_dir, daemon)
+    if conf_dir == data_dir and any(arg.startswith(_CHAIN_SELECT_ARGS) for arg in cli_args):
+        # The chain's own dir (pbaas_dir) isn't configured or created yet; the .conf in
+        # data_dir belongs to the parent chain and would probe the wrong daemon
+        return None
+    try:
+        confs = [name for name in os.listdir(conf_dir) if name.endswith(".conf")]
+    except OSError:
+        return None
+    if len(confs) != 1:
+        return None  # Not written yet, or ambiguous which one the CLI would use
+
+    settings = {}
+    try:
+        with open(os.path.join(conf_dir, confs[0]), "r") as f:
+            for line in f:
+                key, sep, value = line.partition("=")
+                if sep:
+                    settings[key.strip()] = value.strip()
+    except OSError:
+        return None
+
+    port = settings.get("rpcport")
+    if not port:
+        return None
+    if settings.get("rpcuser") and settings.get("rpcpassword"):
+        auth = (settings["rpcuser"], settings["rpcpassword"])
+    else:
+        try:
+            with open(os.path.join(conf_dir, ".cookie"), "r") as f:
+                user, _, password = f.read().strip().partition(":")
+        except OSError:
+            return None
+        auth = (user, password)
+    host = settings.get("rpcconnect", "127.0.0.1")
+    return f"http://{host}:{port}/", auth
+
+# Local RPC gets its own session: it must never pick up http_proxy from the environment,
+# which would send the rpcuser/rpcpassword to the proxy
+_rpc_session = requests.Session()
+_rpc_session.trust_env = False
+
+def rpc_call(rpc_config, method, params=None):
+    """
+    Calls a JSON-RPC method on the daemon. Errors are returned as {"error": ...} in the
+    same shape the CLI prints them; returns None if the caller should fall back to the CLI.
+    """
+    url, auth = rpc_config
+    payload = {"jsonrpc": "1.0", "id": "anchord", "method": method, "params": params or []}
+    try:
+        resp = _rpc_session.post(url, json=payload, auth=auth, timeout=(1, 3))
+        body = resp.json()
+    except requests.ConnectionError:
+        return {"error": _RPC_REFUSED_ERROR}
+    except (requests.RequestException, ValueError):
+        return None  # Slow response, or not JSON (e.g. 401 with an empty body)
+    if not isinstance(body, dict):
+        return None
+    error = body.get("error")
+    if error:
+        if isinstance(error, dict):
+            return {"error": f"error code: {error.get('code')}\nerror message:\n{error.get('message')}"}
+        return {"error": str(error)}
+    return body.get("result")
+
+def getinfo(cli_path, data_dir, cli_args, daemon=None, verify_down=False):
+    """
+    Runs getinfo to check if the daemon is running. Talks JSON-RPC directly when the
+    daemon's .conf has what's needed, which avoids forking the CLI on every probe.
+    With verify_down, a refused RPC connection is double-checked with the CLI before
+    the daemon is reported as down (e.g. the .conf has a stale rpcport).
+    """
+    if not any(arg.startswith(_RPC_OVERRIDE_ARGS) for arg in cli_args):
+        rpc_config = read_rpc_config(data_dir, daemon, cli_args)
+        if rpc_config:
+            info = rpc_call(rpc_config, "getinfo")
+            if isinstance(info, dict) and not (verify_down and info.get("error") == _RPC_REFUSED_ERROR):
+                return info
     try:
         result = subprocess.run([cli_path, f"-datadir={data_dir}"] + cli_args + ["getinfo"], capture_output=True, text=True)
         if result.returncode == 0:
@@ -230,30 +492,52 @@ def get_log_file_position(data_dir, daemon=None):
     log_dir = resolve_log_dir(data_dir, daemon)
     debug_log_path = os.path.join(log_dir, 'debug.log')
     try:
-        with open(debug_log_path, 'r') as log_file:
-            log_file.seek(0, os.SEEK_END)
-            return log_file.tell()
+        return os.path.getsize(debug_log_path)
     except FileNotFoundError:
         return 0
 
+_LOG_BLOCK_SIZE = 64 * 1024
+
 def read_debug_log(data_dir, last_position, last_message, daemon=None):
     """Reads new unique lines from the debug.log file, ignore timestamps and UpdateTip messages."""
     log_dir = resolve_log_dir(data_dir, daemon)
     debug_log_path = os.path.join(log_dir, 'debug.log')
     new_lines = []
     try:
-        with open(debug_log_path, 'r') as log_file:
+        with open(debug_log_path, 'rb') as log_file:
             log_file.seek(last_position)
-            for line in log_file:
-                stripped_line = re.sub(r'^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2} ', '', line).strip()
-                if stripped_line.startswith("UpdateTip"):
-                    continue  # Ignore UpdateTip messages
-                if stripped_line != last_message:
-                    new_lines.append(stripped_line)
-                    last_message = stripped_line
-            last_position = log_file.tell()
+            carry = bytearray()
+            while True:
+                block = log_file.read(_LOG_BLOCK_SIZE)
+                if not block:
+                    break
+                carry += block
+                end = carry.rfind(b'\n')
+                if end < 0:
+                    continue  # No complete line yet
+                # Decode every complete line in the block at once, keep the partial tail
+                chunk = carry[:end].decode('utf-8', 'replace')
+                del carry[:end + 1]
+                for line in chunk.split('\n'):
+                    # Fast path: fixed-width "YYYY-MM-DD HH:MM:SS " prefix, no regex needed
+                    if (len(line) > _TS_LEN and line[4] == '-' and line[7] == '-' and line[10] == ' '
+                            and line[13] == ':' and line[16] == ':' and line[19] == ' '
+                            and line[:4].isdigit()):
+                        if line.startswith("UpdateTip", _TS_LEN):
+                            continue  # Ignore UpdateTip messages
+                        stripped_line = line[_TS_LEN:].strip()
+                    else:
+                        stripped_line = _TS_RE.sub('', line, count=1).strip()
+                    if stripped_line.startswith("UpdateTip"):
+                        continue  # Ignore UpdateTip messages
+                    if stripped_line != last_message:
+                        new_lines.append(stripped_line)
+                        last_message = stripped_line
+            # Leave a partially written last line to be picked up on the next pass
+            last_position = log_file.tell() - len(carry)
     except FileNotFoundError:
         new_lines.append("debug.log not found.")
+        last_position = 0  # Read a recreated log from the start (and stop re-reporting it)
     return new_lines, last_position, last_message
 
 def preflight_paths(daemon):
@@ -285,30 +569,28 @@ def preflight_paths(daemon):
         print(f"[{daemon['name']}] Warning: data_dir is on a GVFS/FUSE mount ({data_dir}). That's fine for data, "
               "but do not place executables there (noexec mounts often block execution).")
 
-    return (cli_abs, daemon_abs, data_dir, not problems)
-
-def launch_daemon(daemon_name, daemon_path, data_dir, daemon_args):
-    """Starts the daemon process"""
-    abs_path = resolve_executable(daemon_path)
-    if not abs_path:
-        explain_exec_problem(f"{daemon_name} daemon", daemon_path)
-        return False
+    return DaemonPaths(cli_abs, daemon_abs, data_dir, not problems)
 
+def launch_daemon(daemon_name, abs_path, data_dir, daemon_args):
+    """
+    Starts the daemon process, returns its Popen handle or None on failure.
+    abs_path must already be resolved and checked by preflight_paths.
+    """
     try:
-        subprocess.Popen(
+        proc = subprocess.Popen(
             [abs_path, f"-datadir={data_dir}"] + daemon_args + ["-daemon"],
             stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
         )
         print(f"[{daemon_name}] beep bop - initializing...")
-        return True
+        return proc
     except FileNotFoundError:
-        # (Shouldnt happen after resolve_executable)
+        # (Shouldnt happen after preflight_paths)
         explain_exec_problem(f"{daemon_name} daemon", abs_path)
-        return False
+        return None
     except PermissionError as e:
         print(red_error(f"\n[{daemon_name}] Permission denied when executing {abs_path}: {e}"))
         print("[!] Ensure the file is executable (chmod +x) and not on a noexec mount.")
-        return False
+        return None
     except OSError as e:
         # Catch noexec 
         if e.errno in (errno.EACCES, getattr(errno, 'EPERM', -1)):
@@ -316,37 +598,141 @@ def launch_daemon(daemon_name, daemon_path, data_dir, daemon_args):
             print("[!] Likely a noexec mount (e.g., GVFS/FUSE). Move the binary to a local filesystem and try again.")
         else:
             print(f"[{daemon_name}] Failed to start daemon: {e}")
-        return False
+        return None
 
 
-def monitor_startup(daemon_name, cli_path, data_dir, cli_args, daemon=None):
-    """Monitors the daemon until it starts successfully."""
-    last_error = None
+_POLL_MIN = 0.1  # seconds
+_POLL_MAX = 2.0
+_POLL_BACKOFF = 1.5
+_ERROR_REPEAT_WINDOW = 10.0  # seconds a startup message stays suppressed after it was last seen
+
+def write_lines(lines):
+    """Writes lines to stdout with a single write and flush."""
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+
+# (substring, status) pairs checked in order against getinfo errors while starting up;
+# anything unmatched is shown as the daemon's own message
+_STARTUP_ERRORS = (
+    ("couldn't connect to server", "starting RPC server"),
+)
+
+def startup_status(error):
+    """Turns a getinfo error into the short status line shown during startup."""
+    message = error.rpartition("error message:")[2].strip()
+    for needle, status in _STARTUP_ERRORS:
+        if needle in message:
+            return status
+    return message
+
+def monitor_startup(daemon_name, cli_path, data_dir, cli_args, daemon=None, proc=None):
+    """
+    Monitors the daemon until it starts successfully. Returns False if the launched
+    process (proc) exits with an error before the daemon becomes ready.
+    """
+    recent_errors = OrderedDict()  # message -> last seen, oldest first
     last_log_position = get_log_file_position(data_dir, daemon)  # Skip existing log entries
     last_message = None
+    # Log polling backs off while debug.log is quiet and resets when it grows;
+    # getinfo probes back off on their own so an active log doesn't spam the CLI
+    delay = _POLL_MIN
+    probe_delay = _POLL_MIN
+    next_probe = 0.0
     while True:
-        info = getinfo(cli_path, data_dir, cli_args)
-        if "error" in info:
-            error_message = info["error"].split("error message:")[-1].strip()
-            if "couldn't connect to server" in error_message:
-                error_message = "starting RPC server"
-            if error_message != last_error:
-                print(f"[{daemon_name}] {error_message}")
-                last_error = error_message
-
-            # Read new unique lines from debug.log
+        out = []  # Everything printed this pass goes out in one write
+        now = time.monotonic()
+        if now >= next_probe:
+            # Once probes have backed off, let the CLI confirm refusals so a stale
+            # rpcport in the .conf can't keep startup spinning forever
+            info = getinfo(cli_path, data_dir, cli_args, daemon, verify_down=probe_delay >= _POLL_MAX)
+            if "error" not in info:
+                print(f"{daemon_name} daemon initialized - ready for RPC commands\n\n")
+                return True
+            error_message = startup_status(info["error"])
+            # Only print messages not seen recently, so daemons cycling through a few don't spam
+            while recent_errors and now - next(iter(recent_errors.values())) > _ERROR_REPEAT_WINDOW:
+                recent_errors.popitem(last=False)
+            if error_message not in recent_errors:
+                out.append(f"[{daemon_name}] {error_message}")
+            recent_errors[error_message] = now
+            recent_errors.move_to_end(error_message)
+            next_probe = now + probe_delay
+            probe_delay = min(probe_delay * _POLL_BACKOFF, _POLL_MAX)
+
+        # Read new unique lines from debug.log, only if it has changed size
+        new_log_lines = []
+        if get_log_file_position(data_dir, daemon) != last_log_position:
             new_log_lines, last_log_position, last_message = read_debug_log(
                 data_dir,
                 last_log_position,
                 last_message,
                 daemon
             )
-            for line in new_log_lines:
-                print(f"[{daemon_name} startup] {line}")
-            time.sleep(1)
+            out.extend(f"[{daemon_name} startup] {line}" for line in new_log_lines)
+
+        # With -daemon the launched process forks and exits 0; anything else means it died
+        if proc is not None:
+            rc = proc.poll()
+            if rc is not None:
+                if rc != 0:
+                    out.append(red_error(f"[{daemon_name}] daemon exited with code {rc}"))
+                    write_lines(out)
+                    return False
+                proc = None
+
+        if new_log_lines:
+            delay = _POLL_MIN
         else:
-            print(f"{daemon_name} daemon initialized - ready for RPC commands\n\n")
-            return
+            delay = min(delay * _POLL_BACKOFF, _POLL_MAX)
+        write_lines(out)
+        time.sleep(delay)
+
+# Above this size pygments tokenizing dominates, so JSON is printed uncoloured
+_HIGHLIGHT_LIMIT = 256 * 1024
+
+_JSON_LEXER = JsonLexer()
+_MONOKAI_FMT = Terminal256Formatter(style="monokai")
+
+def _dump_json(obj):
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits
+    return json.dumps(obj, indent=2)
+
+_CLI_BLOCK_SIZE = 64 * 1024
+
+def read_cli_output(proc):
+    """
+    Reads a CLI command's stdout. Output that doesn't look like JSON and runs past one
+    block is streamed to the terminal as it arrives and None is returned; anything else
+    is returned whole so it can be pretty-printed.
+    """
+    buf = bytearray()
+    streaming = False
+    looks_json = None
+    while True:
+        block = proc.stdout.read1(_CLI_BLOCK_SIZE)
+        if not block:
+            break
+        if streaming:
+            sys.stdout.buffer.write(block)
+            continue
+        buf += block
+        if looks_json is None and len(buf) > _CLI_BLOCK_SIZE:
+            looks_json = buf.lstrip()[:1] in (b"{", b"[")
+            if not looks_json:
+                sys.stdout.flush()
+                sys.stdout.buffer.write(buf)
+                buf.clear()
+                streaming = True
+    if streaming:
+        sys.stdout.buffer.write(b"\n")
+        sys.stdout.flush()
+        return None
+    return buf.decode("utf-8", "replace")
 
 def cli_interaction(cli_path, data_dir, cli_args, daemon_name):
     """Allows user to send commands to the daemon CLI."""
@@ -357,14 +743,37 @@ def cli_interaction(cli_path, data_dir, cli_args, daemon_name):
             break
         args = cmd.split()
         try:
-            result = subprocess.run([cli_path, f"-datadir={data_dir}"] + cli_args + args, capture_output=True, text=True)
-            output = result.stdout if result.returncode == 0 else result.stderr
-            
+            proc = subprocess.Popen(
+                [cli_path, f"-datadir={data_dir}"] + cli_args + args,
+                stdout=subprocess.PIPE, stderr=subprocess.PIPE
+            )
+            # Drain stderr alongside stdout so a chatty child can't fill the pipe and block
+            errors = bytearray()
+            stderr_reader = threading.Thread(target=lambda: errors.extend(proc.stderr.read()), daemon=True)
+            stderr_reader.start()
+            output = read_cli_output(proc)
+            stderr_reader.join()
+            proc.wait()
+            if output is None:
+                # stdout was already streamed to the terminal; still show why it failed
+                if proc.returncode != 0:
+                    print(errors.decode("utf-8", "replace"))
+                continue
+            if proc.returncode != 0:
+                output = errors.decode("utf-8", "replace")
+
             # Try to pretty-print JSON responses
             try:
                 json_output = json.loads(output)
-                formatted_json = json.dumps(json_output, indent=4)
-                print(highlight(formatted_json, JsonLexer(), Terminal256Formatter(style="monokai")))
+                if "\n" in output.strip():
+                    # The CLI already pretty-printed it; highlight as-is rather than re-serializing
+                    formatted_json = output.rstrip()
+                else:
+                    formatted_json = _dump_json(json_output)
+                if len(output) > _HIGHLIGHT_LIMIT:
+                    write_lines([formatted_json])
+                else:
+                    write_lines([highlight(formatted_json, _JSON_LEXER, _MONOKAI_FMT)])
             except json.JSONDecodeError:
                 print(output)
         except Exception as e:
@@ -383,29 +792,35 @@ def main():
 
     daemon = daemons[choice]
     daemon_name = daemon["name"]
-    cli_path = daemon["cli_path"]
-    daemon_path = daemon["daemon_path"]
     # Resolve/validate early
-    cli_abs, daemon_abs, data_dir, ok = preflight_paths(daemon)
+    paths = preflight_paths(daemon)
+    cli_abs, daemon_abs, data_dir, ok = paths
     if not ok:
         print(red_error(f"\n[{daemon_name}] Fix the issues above and run again.\n"))
         return
 
+    # Look up the GitHub release in the background while the daemon starts
+    remote_versions = prefetch_remote_versions([daemon])
+
     cli_args = daemon.get("cli_args", [])
     daemon_args = daemon.get("daemon_args", [])
 
-    info = getinfo(cli_abs, data_dir, cli_args)
+    # Confirm with the CLI before deciding the daemon is down and launching another one
+    info = getinfo(cli_abs, data_dir, cli_args, daemon, verify_down=True)
     if "error" in info:
         print(f"{daemon_name} daemon, you there?")
-        if not launch_daemon(daemon_name, daemon_abs, data_dir, daemon_args):
+        proc = launch_daemon(daemon_name, daemon_abs, data_dir, daemon_args)
+        if not proc:
             # Launch failed... dont loop forever, show last error and stop
             return
-        monitor_startup(daemon_name, cli_abs, data_dir, cli_args, daemon)
+        if not monitor_startup(daemon_name, cli_abs, data_dir, cli_args, daemon, proc):
+            return
     else:
         print("Daemon is already running.")
 
-    check_versions(daemon)
+    check_versions(daemon, paths, remote_versions)
     enable_history()
+    enable_completion(daemon_name, cli_abs, data_dir, cli_args)
     cli_interaction(cli_abs, data_dir, cli_args, daemon_name)
 
     